@@ -1,304 +1,473 @@
-'''
-Calendar Satisfaction Problem (CSP) Solver
-Designed to make scheduling those meetings a breeze! Suite of tools
-for efficiently scheduling some n meetings in a given datetime range
-that abides by some number of constraints.
-
-In this module:
-- A solver that uses the backtracking exact solver approach
-- Tools for pruning domains using node and arc consistency
-'''
-from datetime import *
-from date_constraints import *
-from dataclasses import *
-from copy import *
-import random
-
-
-# CSP Backtracking Solver
-# ---------------------------------------------------------------------------
-def solve(n_meetings: int, date_range: set[datetime], constraints: set[DateConstraint]) -> Optional[list[datetime]]:
-    '''
-    When possible, returns a solution to the given CSP based on the need to
-    schedule n meetings within the given date range and abiding by the given
-    set of DateConstraints.
-      - Implemented using the Backtracking exact solution method
-      - May return None when the CSP is unsatisfiable
-    
-    Parameters:
-        n_meetings (int):
-            The number of meetings that must be scheduled, indexed from 0 to n-1
-        date_range (set[datetime]):
-            The range of datetimes in which the n meetings must be scheduled; by default,
-            these are each separated a day apart, but there's nothing to stop these from
-            being meetings scheduled down to the second
-            [!] WARNING: AVOID ALIASING -- Remember that each variable must have its
-            own domain but what's provided is a single reference to a set of datetimes
-        constraints (set[DateConstraint]):
-            A set of DateConstraints specifying how the meetings must be scheduled.
-            See DateConstraint documentation for different types of DateConstraints
-            that might be found, and useful methods for implementing this solver.
-    
-    Returns:
-        Optional[list[datetime]]:
-            If a solution to the CSP exists:
-                Returns a list of datetimes, one for each of the n_meetings, where the
-                datetime at each index corresponds to the meeting of that same index
-            If no solution is possible:
-                Returns None
-    '''
-    assignment: list[datetime] = []
-    solution: Optional[list[datetime]] = []
-    domains: list[set[datetime]] = [date_range.copy() for num in range(n_meetings)]
-    node_consistency(domains, constraints)
-    arc_consistency(domains, constraints)
-    solution = recursive_backtracker(assignment, domains, date_range, constraints)
-    return solution
-
-
-def recursive_backtracker(assignment: list[datetime], domains: list[set[datetime]], date_range: set[datetime], constraints: set[DateConstraint]) -> Optional[list[datetime]]:
-    '''
-    Recursively implements the backtracking method until there is a complete assignment list or the constraints are impossible.
-    
-    Parameters:
-        assignment (list[datetime]):
-            The current list of assigned datetimes.
-        domains (list[set[datetime]]):
-            The domain of possible datetimes at each variable / index.
-        date_range (set[datetime]):
-            The range of datetimes in which the n meetings must be scheduled.
-        constraints (set[DateConstraint]):
-            A set of DateConstraints specifying how the meetings must be scheduled.
-    
-    Returns:
-        Optional[list[datetime]]:
-            If a solution to the CSP exists:
-                Returns a list of datetimes, one for each of the n_meetings, where the
-                datetime at each index corresponds to the meeting of that same index
-            If no solution is possible:
-                Returns None
-    '''
-    if is_complete(assignment, domains, constraints):
-        return assignment
-
-    variable: int = len(assignment)
-    result: Optional[list[datetime]]
-    
-    for date in domains[variable]:
-        consistent: bool = True
-        assignment.append(date)
-        for constraint in constraints:
-            if not constraint.is_satisfied_by_assignment(assignment):
-                consistent = False
-                break
-        if consistent:
-            result = recursive_backtracker(assignment, domains, date_range, constraints)
-            if result is not None:
-                return assignment
-        assignment.pop()
-    
-    return None
-
-
-def is_complete(assignment: list[datetime], domains: list[set[datetime]], constraints: set[DateConstraint]) -> bool:
-    '''
-    Returns whether the assignment is solved by checking whether it has the correct number of variables and follows the constraints.
-    
-    Parameters:
-        assignment (list[datetime]):
-            The current list of assigned datetimes.
-        domains (list[set[datetime]]):
-            The domain of possible datetimes at each variable / index.
-        constraints (set[DateConstraint]):
-            A set of DateConstraints specifying how the meetings must be scheduled.
-    
-    Returns:
-        bool:
-            If the assignment list is the correct number of variables and follows the constraints:
-                Returns True
-            If the assignment list is the incorrect number of variables or does not follow constraint(s):
-                Returns False
-    '''
-    completed: bool = True
-    
-    if len(assignment) == len(domains):
-        for constraint in constraints:
-            if not constraint.is_satisfied_by_assignment(assignment):
-                completed = False
-    else:
-        completed = False
-    
-    return completed
-    
-
-# CSP Filtering: Node Consistency
-# ---------------------------------------------------------------------------
-def node_consistency(domains: list[set[datetime]], constraints: set[DateConstraint]) -> None:
-    '''
-    Enforces node consistency for all variables' domains given in the set of domains.
-    Meetings' domains' index in each of the provided constraints correspond to their index
-    in the list of domains.
-    
-    [!] Note: Only applies to Unary DateConstraints, i.e., those whose arity() method
-    returns 1
-    
-    Parameters:
-        domains (list[set[datetime]]):
-            A list of domains where each domain is a set of possible date times to assign
-            to each meeting. Each domain in the given list is indexed such that its index
-            corresponds to the indexes of meetings mentioned in the given constraints.
-        constraints (set[DateConstraint]):
-            A set of DateConstraints specifying how the meetings must be scheduled.
-            See DateConstraint documentation for different types of DateConstraints
-            that might be found, and useful methods for implementing this solver.
-            [!] Hint: see a DateConstraint's is_satisfied_by_values
-    
-    Side Effects:
-        Although no values are returned, the values in any pruned domains are changed
-        directly within the provided domains parameter
-    '''
-    unary_constraints: set[DateConstraint] = set()
-    for constraint in constraints:
-        if constraint.arity() == 1:
-            unary_constraints.add(constraint)
-
-    domain_copy: list[datetime]
-    index: int = 0
-    
-    for domain in domains:
-        domain_copy = list(domain)
-        for date in domain_copy:
-            for unary_constraint in unary_constraints:
-                if unary_constraint.L_VAL == index and not unary_constraint.is_satisfied_by_values(date):
-                    domain.remove(date)
-                    break
-        index += 1
-    
-    return
-
-
-# CSP Filtering: Arc Consistency
-# ---------------------------------------------------------------------------
-class Arc:
-    '''
-    Helper Arc class to be used to organize domains for pruning during the AC-3
-    algorithm, organized as (TAIL -> HEAD) Arcs that correspond to a given
-    CONSTRAINT.
-    
-    [!] Although you do not need to, you *may* modify this class however you see
-    fit to accomplish the arc_consistency method
-    
-    Attributes:
-        CONSTRAINT (DateConstraint):
-            The DateConstraint represented by this arc
-        TAIL (int):
-            The index of the meeting variable at this arc's tail.
-        HEAD (int):
-            The index of the meeting variable at this arc's head.
-    
-    [!] IMPORTANT: By definition, the TAIL = CONSTRAINT.L_VAL and
-        HEAD = CONSTRAINT.R_VAL
-    '''
-    
-    def __init__(self, constraint: DateConstraint):
-        '''
-        Constructs a new Arc from the given DateConstraint, setting this Arc's
-        TAIL to the constraint's L_VAL and its HEAD to the constraint's R_VAL
-        
-        Parameters:
-            constraint (DateConstraint):
-                The constraint represented by this Arc
-        '''
-        self.CONSTRAINT: DateConstraint = constraint
-        self.TAIL: int = constraint.L_VAL
-        if isinstance(constraint.R_VAL, int):
-            self.HEAD: int = constraint.R_VAL
-        else:
-            raise ValueError("[X] Cannot create Arc from Unary Constraint")
-    
-    def __eq__(self, other: Any) -> bool:
-        if other is None: return False
-        if not isinstance(other, Arc): return False
-        return self.CONSTRAINT == other.CONSTRAINT and self.TAIL == other.TAIL and self.HEAD == other.HEAD
-    
-    def __hash__(self) -> int:
-        return hash((self.CONSTRAINT, self.TAIL, self.HEAD))
-    
-    def __str__(self) -> str:
-        return "Arc[" + str(self.CONSTRAINT) + ", (" + str(self.TAIL) + " -> " + str(self.HEAD) + ")]"
-    
-    def __repr__(self) -> str:
-        return self.__str__()
-
-def arc_consistency(domains: list[set[datetime]], constraints: set[DateConstraint]) -> None:
-    '''
-    Enforces arc consistency for all variables' domains given in the set of domains.
-    Meetings' domains' index in each of the provided constraints correspond to their index
-    in the list of domains.
-    
-    [!] Note: Only applies to Binary DateConstraints, i.e., those whose arity() method
-    returns 2
-    
-    Parameters:
-        domains (list[set[datetime]]):
-            A list of domains where each domain is a set of possible date times to assign
-            to each meeting. Each domain in the given list is indexed such that its index
-            corresponds to the indexes of meetings mentioned in the given constraints.
-        constraints (set[DateConstraint]):
-            A set of DateConstraints specifying how the meetings must be scheduled.
-            See DateConstraint documentation for different types of DateConstraints
-            that might be found, and useful methods for implementing this solver.
-            [!] Hint: see a DateConstraint's is_satisfied_by_values
-    
-    Side Effects:
-        Although no values are returned, the values in any pruned domains are changed
-        directly within the provided domains parameter
-    '''
-    arcs: set[Arc] = set()
-    for constraint in constraints:
-        if constraint.arity() == 2:
-            arcs.add(Arc(constraint))
-            arcs.add(Arc(constraint.get_reverse()))
-
-    original_arcs: set[Arc] = arcs.copy()
-    arc: "Arc"
-    while len(arcs) > 0:
-        arc = arcs.pop()
-        if remove_inconsistent_values(domains, arc):
-            for original_arc in original_arcs:
-                if original_arc.HEAD == arc.TAIL:
-                    arcs.add(original_arc)
-    
-    return
-
-
-def remove_inconsistent_values(domains: list[set[datetime]], arc: "Arc") -> bool:
-    '''
-    Checks for inconsistencies in the arc and removes the dates that are inconsistent
-    from the tail domain. An arc is consistent if for all values in the tail domain
-    there is at least one value in the head domain that satisfies the arc's constraint.
-    
-    Parameters:
-        domains (list[set[datetime]]):
-            A list of domains where each domain is a set of possible date times to assign
-            to each meeting. Each domain in the given list is indexed such that its index
-            corresponds to the indexes of meetings mentioned in the given constraints.
-        arc (Arc):
-            A singular arc that is to be checked for consistency using its head and tail.
-    '''
-    removed: bool = False
-    consistent: bool
-    tail_domains: set[datetime] = domains[arc.TAIL].copy()
-    
-    for tail_date in tail_domains:
-        consistent = False
-        for head_date in domains[arc.HEAD]:
-            if arc.CONSTRAINT.is_satisfied_by_values(tail_date, head_date):
-                consistent = True
-                break
-        if not consistent:
-            domains[arc.TAIL].remove(tail_date)
-            removed = True
-    
-    return removed
-
+'''
+Calendar Satisfaction Problem (CSP) Solver
+Designed to make scheduling those meetings a breeze! Suite of tools
+for efficiently scheduling some n meetings in a given datetime range
+that abides by some number of constraints.
+
+In this module:
+- A solver that uses the backtracking exact solver approach
+- Tools for pruning domains using node and arc consistency
+'''
+from datetime import *
+from date_constraints import *
+from dataclasses import *
+from collections import deque
+from copy import *
+import random
+
+
+# CSP Domains
+# ---------------------------------------------------------------------------
+class Domain:
+    '''
+    Helper class representing a single meeting variable's domain of candidate
+    datetimes. Rather than giving every variable its own full copy of the date
+    range, each Domain shares one immutable base set and records only the values
+    that have been pruned from it, keeping memory proportional to what filtering
+    actually removes. Should most of the base end up pruned, the Domain compacts
+    itself down to the surviving values.
+
+    Supports the small set-like interface (iteration, len, membership, remove,
+    copy) relied upon by the filtering methods below, so plain sets of datetimes
+    may be substituted when calling those directly; the backtracking search
+    additionally uses restore to undo forward-checking prunes.
+
+    Attributes:
+        base (frozenset[datetime]):
+            The shared, immutable set of datetimes the domain started from.
+        removed (set[datetime]):
+            The datetimes pruned from base so far.
+    '''
+
+    __slots__ = ('base', 'removed')
+
+    def __init__(self, base: set[datetime]):
+        '''
+        Constructs a new Domain over the given base set of datetimes, from which
+        nothing has yet been pruned.
+
+        Parameters:
+            base (set[datetime]):
+                The set of candidate datetimes this Domain begins with.
+        '''
+        self.base: frozenset[datetime] = frozenset(base)
+        self.removed: set[datetime] = set()
+
+    def __iter__(self) -> Iterator[datetime]:
+        return (date for date in self.base if date not in self.removed)
+
+    def __len__(self) -> int:
+        return len(self.base) - len(self.removed)
+
+    def __contains__(self, date: Any) -> bool:
+        return date in self.base and date not in self.removed
+
+    def remove(self, date: datetime) -> None:
+        '''
+        Prunes the given datetime from this Domain. Once more than half of the
+        base has been pruned, rebuilds the base from the surviving values so the
+        removal set never grows past half the original domain.
+
+        Parameters:
+            date (datetime):
+                The datetime to prune; must currently be in the Domain.
+        '''
+        self.removed.add(date)
+        if 2 * len(self.removed) > len(self.base):
+            self.base = frozenset(date for date in self.base if date not in self.removed)
+            self.removed = set()
+
+    def restore(self, dates: set[datetime]) -> None:
+        '''
+        Re-adds the given previously-pruned datetimes to this Domain, e.g., when
+        a forward-checking prune is undone upon backtracking. Handles dates that
+        were compacted out of the base since being removed.
+
+        Parameters:
+            dates (set[datetime]):
+                The datetimes to return to the Domain.
+        '''
+        self.removed -= dates
+        missing: set[datetime] = {date for date in dates if date not in self.base}
+        if missing:
+            self.base |= missing
+
+    def copy(self) -> set[datetime]:
+        '''
+        Returns:
+            set[datetime]:
+                A new set containing this Domain's surviving datetimes.
+        '''
+        return set(self)
+
+
+# CSP Backtracking Solver
+# ---------------------------------------------------------------------------
+def solve(n_meetings: int, date_range: set[datetime], constraints: set[DateConstraint]) -> Optional[list[datetime]]:
+    '''
+    When possible, returns a solution to the given CSP based on the need to
+    schedule n meetings within the given date range and abiding by the given
+    set of DateConstraints.
+      - Implemented using the Backtracking exact solution method
+      - May return None when the CSP is unsatisfiable
+    
+    Parameters:
+        n_meetings (int):
+            The number of meetings that must be scheduled, indexed from 0 to n-1
+        date_range (set[datetime]):
+            The range of datetimes in which the n meetings must be scheduled; by default,
+            these are each separated a day apart, but there's nothing to stop these from
+            being meetings scheduled down to the second
+            [!] WARNING: AVOID ALIASING -- Remember that each variable must have its
+            own domain but what's provided is a single reference to a set of datetimes
+        constraints (set[DateConstraint]):
+            A set of DateConstraints specifying how the meetings must be scheduled.
+            See DateConstraint documentation for different types of DateConstraints
+            that might be found, and useful methods for implementing this solver.
+    
+    Returns:
+        Optional[list[datetime]]:
+            If a solution to the CSP exists:
+                Returns a list of datetimes, one for each of the n_meetings, where the
+                datetime at each index corresponds to the meeting of that same index
+            If no solution is possible:
+                Returns None
+    '''
+    assignment: dict[int, datetime] = dict()
+    domains: list["Domain"] = [Domain(date_range) for num in range(n_meetings)]
+    node_consistency(domains, constraints)
+    arc_consistency(domains, constraints)
+
+    constraints_by_var: dict[int, list[DateConstraint]] = {}
+    for constraint in constraints:
+        constraints_by_var.setdefault(constraint.L_VAL, []).append(constraint)
+        if constraint.arity() == 2:
+            constraints_by_var.setdefault(constraint.R_VAL, []).append(constraint)
+
+    solution: Optional[list[datetime]] = recursive_backtracker(assignment, domains, constraints, constraints_by_var)
+    return solution
+
+
+def recursive_backtracker(assignment: dict[int, datetime], domains: list["Domain"], constraints: set[DateConstraint], constraints_by_var: dict[int, list[DateConstraint]]) -> Optional[list[datetime]]:
+    '''
+    Recursively implements the backtracking method until there is a complete assignment or the constraints are impossible.
+      - Selects the next variable by the Minimum-Remaining-Values heuristic, i.e., the
+        unassigned variable with the fewest surviving domain values
+      - Checks only the constraints that mention the just-assigned variable and whose
+        other variable (if any) is already assigned, since earlier assignments have
+        already been validated
+      - Forward-checks after each assignment by pruning now-inconsistent values from
+        unassigned neighbors' domains (restored upon backtracking), abandoning the
+        branch early if any neighbor's domain empties
+
+    Parameters:
+        assignment (dict[int, datetime]):
+            The currently assigned datetimes, keyed by meeting variable index.
+        domains (list[Domain]):
+            The domain of possible datetimes at each variable / index.
+        constraints (set[DateConstraint]):
+            A set of DateConstraints specifying how the meetings must be scheduled.
+        constraints_by_var (dict[int, list[DateConstraint]]):
+            The same constraints, indexed by each meeting variable they mention.
+
+    Returns:
+        Optional[list[datetime]]:
+            If a solution to the CSP exists:
+                Returns a list of datetimes, one for each of the n_meetings, where the
+                datetime at each index corresponds to the meeting of that same index
+            If no solution is possible:
+                Returns None
+    '''
+    if is_complete(assignment, domains, constraints):
+        return [assignment[variable] for variable in range(len(domains))]
+
+    variable: int = min((var for var in range(len(domains)) if var not in assignment), key=lambda var: len(domains[var]))
+    result: Optional[list[datetime]]
+
+    for date in list(domains[variable]):
+        consistent: bool = True
+        assignment[variable] = date
+        for constraint in constraints_by_var.get(variable, []):
+            if not _is_satisfied_by_partial(constraint, assignment):
+                consistent = False
+                break
+
+        if consistent:
+            pruned: list[tuple[int, set[datetime]]] = _forward_check(variable, assignment, domains, constraints_by_var)
+            if all(len(domains[var]) > 0 for var, dates in pruned):
+                result = recursive_backtracker(assignment, domains, constraints, constraints_by_var)
+                if result is not None:
+                    return result
+            for var, dates in pruned:
+                domains[var].restore(dates)
+        del assignment[variable]
+
+    return None
+
+
+def _is_satisfied_by_partial(constraint: DateConstraint, assignment: dict[int, datetime]) -> bool:
+    '''
+    Returns whether the given constraint is satisfied by the given partial assignment,
+    where a constraint mentioning any still-unassigned variable is trivially satisfied.
+
+    Parameters:
+        constraint (DateConstraint):
+            The constraint to check against the partial assignment.
+        assignment (dict[int, datetime]):
+            The currently assigned datetimes, keyed by meeting variable index.
+
+    Returns:
+        bool:
+            Whether the constraint is satisfied by (or not yet applicable to) the assignment.
+    '''
+    if constraint.L_VAL not in assignment:
+        return True
+    if constraint.arity() == 1:
+        return constraint.is_satisfied_by_values(assignment[constraint.L_VAL])
+    if constraint.R_VAL not in assignment:
+        return True
+    return constraint.is_satisfied_by_values(assignment[constraint.L_VAL], assignment[constraint.R_VAL])
+
+
+def _forward_check(variable: int, assignment: dict[int, datetime], domains: list["Domain"], constraints_by_var: dict[int, list[DateConstraint]]) -> list[tuple[int, set[datetime]]]:
+    '''
+    Prunes the domains of unassigned variables that share a binary constraint with
+    the just-assigned variable, removing any values inconsistent with its new date.
+
+    Parameters:
+        variable (int):
+            The meeting variable that was just assigned.
+        assignment (dict[int, datetime]):
+            The currently assigned datetimes, keyed by meeting variable index.
+        domains (list[Domain]):
+            The domain of possible datetimes at each variable / index.
+        constraints_by_var (dict[int, list[DateConstraint]]):
+            The constraints, indexed by each meeting variable they mention.
+
+    Returns:
+        list[tuple[int, set[datetime]]]:
+            The (variable, pruned dates) pairs removed by this check, to be restored
+            by the caller upon backtracking.
+    '''
+    date: datetime = assignment[variable]
+    pruned: list[tuple[int, set[datetime]]] = []
+
+    for constraint in constraints_by_var.get(variable, []):
+        if constraint.arity() != 2:
+            continue
+        other: int = constraint.R_VAL if constraint.L_VAL == variable else constraint.L_VAL
+        if other in assignment:
+            continue
+
+        doomed: set[datetime]
+        if constraint.L_VAL == variable:
+            doomed = {other_date for other_date in domains[other] if not constraint.is_satisfied_by_values(date, other_date)}
+        else:
+            doomed = {other_date for other_date in domains[other] if not constraint.is_satisfied_by_values(other_date, date)}
+
+        if doomed:
+            for other_date in doomed:
+                domains[other].remove(other_date)
+            pruned.append((other, doomed))
+            if len(domains[other]) == 0:
+                break
+
+    return pruned
+
+
+def is_complete(assignment: dict[int, datetime], domains: list["Domain"], constraints: set[DateConstraint]) -> bool:
+    '''
+    Returns whether the assignment is solved, i.e., whether it has assigned every variable.
+
+    [!] Note: no constraints are re-verified here; recursive_backtracker validates each
+    constraint incrementally as its variables are assigned, so any complete assignment
+    it builds is already consistent.
+
+    Parameters:
+        assignment (dict[int, datetime]):
+            The currently assigned datetimes, keyed by meeting variable index.
+        domains (list[Domain]):
+            The domain of possible datetimes at each variable / index.
+        constraints (set[DateConstraint]):
+            A set of DateConstraints specifying how the meetings must be scheduled.
+            (Retained for signature compatibility; see note above.)
+
+    Returns:
+        bool:
+            Whether every meeting variable has been assigned a datetime.
+    '''
+    return len(assignment) == len(domains)
+    
+
+# CSP Filtering: Node Consistency
+# ---------------------------------------------------------------------------
+def node_consistency(domains: list["Domain"], constraints: set[DateConstraint]) -> None:
+    '''
+    Enforces node consistency for all variables' domains given in the set of domains.
+    Meetings' domains' index in each of the provided constraints correspond to their index
+    in the list of domains.
+    
+    [!] Note: Only applies to Unary DateConstraints, i.e., those whose arity() method
+    returns 1
+    
+    Parameters:
+        domains (list[set[datetime]]):
+            A list of domains where each domain is a set of possible date times to assign
+            to each meeting. Each domain in the given list is indexed such that its index
+            corresponds to the indexes of meetings mentioned in the given constraints.
+        constraints (set[DateConstraint]):
+            A set of DateConstraints specifying how the meetings must be scheduled.
+            See DateConstraint documentation for different types of DateConstraints
+            that might be found, and useful methods for implementing this solver.
+            [!] Hint: see a DateConstraint's is_satisfied_by_values
+    
+    Side Effects:
+        Although no values are returned, the values in any pruned domains are changed
+        directly within the provided domains parameter
+    '''
+    unary_by_var: dict[int, list[DateConstraint]] = {}
+    for constraint in constraints:
+        if constraint.arity() == 1:
+            unary_by_var.setdefault(constraint.L_VAL, []).append(constraint)
+
+    for index, domain in enumerate(domains):
+        unary_constraints: Optional[list[DateConstraint]] = unary_by_var.get(index)
+        if unary_constraints is None:
+            continue
+        doomed: set[datetime] = {date for date in domain if not all(constraint.is_satisfied_by_values(date) for constraint in unary_constraints)}
+        for date in doomed:
+            domain.remove(date)
+
+    return
+
+
+# CSP Filtering: Arc Consistency
+# ---------------------------------------------------------------------------
+class Arc:
+    '''
+    Helper Arc class to be used to organize domains for pruning during the AC-3
+    algorithm, organized as (TAIL -> HEAD) Arcs that correspond to a given
+    CONSTRAINT.
+    
+    [!] Although you do not need to, you *may* modify this class however you see
+    fit to accomplish the arc_consistency method
+    
+    Attributes:
+        CONSTRAINT (DateConstraint):
+            The DateConstraint represented by this arc
+        TAIL (int):
+            The index of the meeting variable at this arc's tail.
+        HEAD (int):
+            The index of the meeting variable at this arc's head.
+    
+    [!] IMPORTANT: By definition, the TAIL = CONSTRAINT.L_VAL and
+        HEAD = CONSTRAINT.R_VAL
+    '''
+
+    __slots__ = ('CONSTRAINT', 'TAIL', 'HEAD')
+
+    def __init__(self, constraint: DateConstraint):
+        '''
+        Constructs a new Arc from the given DateConstraint, setting this Arc's
+        TAIL to the constraint's L_VAL and its HEAD to the constraint's R_VAL
+        
+        Parameters:
+            constraint (DateConstraint):
+                The constraint represented by this Arc
+        '''
+        self.CONSTRAINT: DateConstraint = constraint
+        self.TAIL: int = constraint.L_VAL
+        if isinstance(constraint.R_VAL, int):
+            self.HEAD: int = constraint.R_VAL
+        else:
+            raise ValueError("[X] Cannot create Arc from Unary Constraint")
+    
+    def __eq__(self, other: Any) -> bool:
+        if other is None: return False
+        if not isinstance(other, Arc): return False
+        return self.CONSTRAINT == other.CONSTRAINT and self.TAIL == other.TAIL and self.HEAD == other.HEAD
+    
+    def __hash__(self) -> int:
+        return hash((self.CONSTRAINT, self.TAIL, self.HEAD))
+    
+    def __str__(self) -> str:
+        return "Arc[" + str(self.CONSTRAINT) + ", (" + str(self.TAIL) + " -> " + str(self.HEAD) + ")]"
+    
+    def __repr__(self) -> str:
+        return self.__str__()
+
+def arc_consistency(domains: list["Domain"], constraints: set[DateConstraint]) -> None:
+    '''
+    Enforces arc consistency for all variables' domains given in the set of domains.
+    Meetings' domains' index in each of the provided constraints correspond to their index
+    in the list of domains.
+    
+    [!] Note: Only applies to Binary DateConstraints, i.e., those whose arity() method
+    returns 2
+    
+    Parameters:
+        domains (list[set[datetime]]):
+            A list of domains where each domain is a set of possible date times to assign
+            to each meeting. Each domain in the given list is indexed such that its index
+            corresponds to the indexes of meetings mentioned in the given constraints.
+        constraints (set[DateConstraint]):
+            A set of DateConstraints specifying how the meetings must be scheduled.
+            See DateConstraint documentation for different types of DateConstraints
+            that might be found, and useful methods for implementing this solver.
+            [!] Hint: see a DateConstraint's is_satisfied_by_values
+    
+    Side Effects:
+        Although no values are returned, the values in any pruned domains are changed
+        directly within the provided domains parameter
+    '''
+    arcs: set[Arc] = set()
+    for constraint in constraints:
+        if constraint.arity() == 2:
+            arcs.add(Arc(constraint))
+            arcs.add(Arc(constraint.get_reverse()))
+
+    # Index the arcs by their HEAD so that a prune of some variable's domain can
+    # re-enqueue exactly the arcs pointing at it, rather than scanning them all
+    arcs_by_head: dict[int, list[Arc]] = {}
+    for arc in arcs:
+        arcs_by_head.setdefault(arc.HEAD, []).append(arc)
+
+    worklist: deque[Arc] = deque(arcs)
+    enqueued: set[Arc] = set(arcs)
+    while worklist:
+        arc = worklist.popleft()
+        enqueued.discard(arc)
+        if remove_inconsistent_values(domains, arc):
+            for neighbor_arc in arcs_by_head.get(arc.TAIL, []):
+                if neighbor_arc not in enqueued:
+                    worklist.append(neighbor_arc)
+                    enqueued.add(neighbor_arc)
+
+    return
+
+
+def remove_inconsistent_values(domains: list["Domain"], arc: "Arc") -> bool:
+    '''
+    Checks for inconsistencies in the arc and removes the dates that are inconsistent
+    from the tail domain. An arc is consistent if for all values in the tail domain
+    there is at least one value in the head domain that satisfies the arc's constraint.
+    
+    Parameters:
+        domains (list[set[datetime]]):
+            A list of domains where each domain is a set of possible date times to assign
+            to each meeting. Each domain in the given list is indexed such that its index
+            corresponds to the indexes of meetings mentioned in the given constraints.
+        arc (Arc):
+            A singular arc that is to be checked for consistency using its head and tail.
+    '''
+    tail_domain: "Domain" = domains[arc.TAIL]
+    head_domain: "Domain" = domains[arc.HEAD]
+    satisfied: Callable[[datetime, datetime], bool] = arc.CONSTRAINT.is_satisfied_by_values
+
+    doomed: set[datetime] = {tail_date for tail_date in tail_domain
+                             if not any(satisfied(tail_date, head_date) for head_date in head_domain)}
+    for tail_date in doomed:
+        tail_domain.remove(tail_date)
+
+    return len(doomed) > 0
+
@@ -27,33 +27,26 @@ def get_edit_dist_table(row_str: str, col_str: str) -> list[list[int]]:
             edit_distance(row_str, col_str)
     '''
 
-    table: list[list[int]] = [[]]
-    replacement: float
-    transposition: float
-    insertion: float
-    deletion: float
-
-    for col_num in range(len(col_str) + 1):
-        table[0].append(col_num)
-    for row_num in range(1, len(row_str) + 1):
-        table.append([])
-        table[row_num].append(row_num)
+    table: list[list[int]] = [[0] * (len(col_str) + 1) for row_num in range(len(row_str) + 1)]
+    table[0] = list(range(len(col_str) + 1))
+    distance: int
 
     for row_index in range(1, len(row_str) + 1):
+        prev_row: list[int] = table[row_index - 1]
+        current_row: list[int] = table[row_index]
+        current_row[0] = row_index
+        row_char: str = row_str[row_index - 1]
         for col_index in range(1, len(col_str) + 1):
-            if col_str[col_index - 1] == row_str[row_index - 1]:
-                table[row_index].append(table[row_index - 1][col_index - 1])
+            if col_str[col_index - 1] == row_char:
+                current_row[col_index] = prev_row[col_index - 1]
             else:
-                replacement = float(table[row_index - 1][col_index - 1] + 1)
-                deletion = float(table[row_index - 1][col_index] + 1)
-                insertion = float(table[row_index][col_index - 1] + 1)
+                # Replacement, deletion, and insertion, in that order
+                distance = min(prev_row[col_index - 1], prev_row[col_index], current_row[col_index - 1]) + 1
 
-                if row_index >= 2 and col_index >= 2 and col_str[col_index - 1] == row_str[row_index - 2] and col_str[col_index - 2] == row_str[row_index - 1]:
-                    transposition = float(table[row_index - 2][col_index - 2] + 1)
-                else:
-                    transposition = float('inf')
+                if row_index >= 2 and col_index >= 2 and col_str[col_index - 1] == row_str[row_index - 2] and col_str[col_index - 2] == row_char:
+                    distance = min(distance, table[row_index - 2][col_index - 2] + 1)
 
-                table[row_index].append(int(min(replacement, transposition, insertion, deletion)))
+                current_row[col_index] = distance
 
     return table
 
@@ -121,52 +114,32 @@ def get_transformation_list_with_table(s0: str, s1: str, table: list[list[int]])
     and is being used by multiple methods.
 
     [!] MUST use the already-solved memoization table and must NOT recompute it.
-    [!] MUST be implemented recursively (i.e., in top-down fashion)
-    '''
-    
-    transformations: list[str] = []
-    return recursion(s0, s1, table, transformations)
-
-
-def recursion(s0: str, s1: str, table: list[list[int]], transformations: list[str]) -> list[str]:
-    '''
-    The helper method that helps get_transformation_list_with_table()
-    recursively carry out top-down dynamic programming.
-    
-    Parameters:
-        s0, s1 (str):
-            Start and destination strings for the transformation.
-        table (list[list[int]]):
-            Pre-computed memoization table of the two string parameters.
-        transformations (list[str]):
-            The current, but not completed, sequence of top-down manipulations required to turn s0 into s1,
-            continuously edited everytime the recursive method is called.
-    
-    Returns:
-        list[str]:
-            The sequence of top-down manipulations required to turn s0 into s1
+    [!] Walks the table top-down (i.e., starting from the largest subproblem),
+        tracking integer indices into the original strings rather than slicing them.
     '''
 
-    if (len(s0) == 0 and len(s1) == 0) or table[len(s0)][len(s1)] == 0:
-        return transformations
-
-    if len(s0) > 0 and len(s1) > 0 and s0[-1] == s1[-1]:
-        s0 = s0[:-1]
-        s1 = s1[:-1]
-    elif len(s0) >= 1 and len(s1) >= 1 and (table[len(s0)][len(s1)] == (table[len(s0) - 1][len(s1) - 1] + 1)):
-        transformations.append("R")
-        s0 = s0[:-1]
-        s1 = s1[:-1]
-    elif len(s0) >= 2 and len(s1) >= 2 and (s0[-1] == s1[-2] and s0[-2] == s1[-1]):
-        transformations.append("T")
-        s0 = s0[:-2]
-        s1 = s1[:-2]
-    elif len(s1) >= 1 and table[len(s0)][len(s1)] == (table[len(s0)][len(s1) - 1] + 1):
-        transformations.append("I")
-        s1 = s1[:-1]
-    elif len(s0) >= 1 and table[len(s0)][len(s1)] == (table[len(s0) - 1][len(s1)] + 1):
-        transformations.append("D")
-        s0 = s0[:-1]
-
-    return recursion(s0, s1, table, transformations)
+    transformations: list[str] = []
+    row_index: int = len(s0)
+    col_index: int = len(s1)
+
+    while (row_index > 0 or col_index > 0) and table[row_index][col_index] != 0:
+        if row_index > 0 and col_index > 0 and s0[row_index - 1] == s1[col_index - 1]:
+            row_index -= 1
+            col_index -= 1
+        elif row_index >= 1 and col_index >= 1 and table[row_index][col_index] == (table[row_index - 1][col_index - 1] + 1):
+            transformations.append("R")
+            row_index -= 1
+            col_index -= 1
+        elif row_index >= 2 and col_index >= 2 and (s0[row_index - 1] == s1[col_index - 2] and s0[row_index - 2] == s1[col_index - 1]):
+            transformations.append("T")
+            row_index -= 2
+            col_index -= 2
+        elif col_index >= 1 and table[row_index][col_index] == (table[row_index][col_index - 1] + 1):
+            transformations.append("I")
+            col_index -= 1
+        elif row_index >= 1 and table[row_index][col_index] == (table[row_index - 1][col_index] + 1):
+            transformations.append("D")
+            row_index -= 1
+
+    return transformations
 
@@ -5,12 +5,12 @@ Author: Mike Hennessy
 Modify only this file as part of your submission, as it will contain all of the logic
 necessary for implementing the A* pathfinder that solves the target practice problem.
 '''
-import queue
+import heapq
 from maze_problem import MazeProblem
 from dataclasses import *
 from typing import *
 
-@dataclass
+@dataclass(slots=True)
 class SearchTreeNode:
     """
     SearchTreeNodes contain the following attributes to be used in generation of
@@ -29,14 +29,16 @@ class SearchTreeNode:
     parent: Optional["SearchTreeNode"]
     """
     Implemented two new attrbiutes:
-        shot_target (list[tuple[int, int]]):
-            A list of all of the targets shot by the node thus far.
+        shot_mask (int):
+            A bitmask of the targets shot by the node thus far, with each
+            initial target assigned one bit, so graveyard hashing and the
+            goal test are O(1) int operations.
         past_cost (int):
             The total cost of the transitions that the node has taken.
         priority (int):
             The priority of the node calculated by the heuristic and added to the priority queue.
     """
-    shot_targets: list[tuple[int, int]]
+    shot_mask: int
     past_cost: int
     priority: int
 
@@ -44,6 +46,88 @@ class SearchTreeNode:
             return self.priority < other.priority
 
 
+# Free list of retired SearchTreeNodes recycled by make_node, sparing the
+# small-object allocator one dataclass instance per reuse
+_node_pool: list["SearchTreeNode"] = []
+
+
+def make_node(player_loc: tuple[int, int], action: str, parent: Optional["SearchTreeNode"],
+              shot_mask: int, past_cost: int, priority: int) -> "SearchTreeNode":
+    """
+    Builds a SearchTreeNode, reinitializing one from the free-list pool when
+    available rather than allocating a fresh instance.
+
+    Parameters:
+        player_loc, action, parent, shot_mask, past_cost, priority:
+            The attribute values for the node, as in SearchTreeNode.
+
+    Returns:
+        SearchTreeNode:
+            A node carrying the given attributes.
+    """
+    if _node_pool:
+        node: "SearchTreeNode" = _node_pool.pop()
+        node.player_loc = player_loc
+        node.action = action
+        node.parent = parent
+        node.shot_mask = shot_mask
+        node.past_cost = past_cost
+        node.priority = priority
+        return node
+    return SearchTreeNode(player_loc, action, parent, shot_mask, past_cost, priority)
+
+
+@dataclass
+class CostPrefixes:
+    """
+    Lazily-built prefix sums of transition costs along each row and column, so
+    the heuristic can price a straight-line run of moves with one subtraction
+    instead of a Python loop of get_transition_cost calls.
+
+    Attributes:
+        problem (MazeProblem):
+            The problem whose transition costs are being tabulated.
+    """
+    problem: "MazeProblem"
+    # The search's fixed bit-to-target assignment, used to decode a shot mask
+    # back into coordinates only when a future cost must actually be computed
+    target_list: list[tuple[int, int]] = field(default_factory=list)
+    _prefixes: dict[tuple[str, int], list[int]] = field(default_factory=dict)
+    # Memoized future costs keyed by (player_loc, shot_mask): duplicate
+    # frontier entries for the same search state share one computation
+    future_costs: dict[tuple[tuple[int, int], int], int] = field(default_factory=dict)
+
+    def line_cost(self, action: str, fixed: int, start: int, stop: int) -> int:
+        """
+        Returns the total cost of repeating the given action from coordinate
+        start up to (but excluding) stop along the row or column at the fixed
+        coordinate, extending the cached prefix sums on first touch.
+
+        Parameters:
+            action (str):
+                The repeated move, one of "L", "R" (fixed is the row) or
+                "U", "D" (fixed is the column).
+            fixed (int):
+                The coordinate of the row or column being traversed.
+            start, stop (int):
+                The half-open range of moving coordinates to price.
+
+        Returns:
+            int:
+                The summed transition cost over the range.
+        """
+        prefix: Optional[list[int]] = self._prefixes.get((action, fixed))
+        if prefix is None:
+            prefix = [0]
+            self._prefixes[(action, fixed)] = prefix
+        if stop >= len(prefix):
+            horizontal: bool = action in ("L", "R")
+            for num in range(len(prefix) - 1, stop):
+                step: int = self.problem.get_transition_cost(action, (num, fixed) if horizontal else (fixed, num))
+                prefix.append(prefix[-1] + step)
+        return prefix[stop] - prefix[start]
+
+
 def find_solution_path(node: Union["SearchTreeNode", Any]) -> list[str]:
     """
     Helper method that unravels path taken from initial state to goal state.
@@ -58,16 +142,19 @@ def find_solution_path(node: Union["SearchTreeNode", Any]) -> list[str]:
             initial state to the goal (a maze with all targets destroyed).
     """
 
+    # Collect actions goal-to-root with O(1) appends, then reverse once,
+    # rather than paying an O(n) shift for every insert at index 0
     solution_path: list[str] = []
-    
+
     while node.parent is not None:
-        solution_path.insert(0, node.action)
+        solution_path.append(node.action)
         node = node.parent
 
+    solution_path.reverse()
     return solution_path
 
 
-def heuristic(node: SearchTreeNode, targets_left: list[tuple[int, int]], problem: "MazeProblem") -> int:
+def heuristic(node: SearchTreeNode, cost_prefixes: "CostPrefixes") -> int:
     """
     Helper method that implements a heuristic to get the priority of each node by adding the
     past cost parameter to a calculated future cost using a manipulation of Manhatten Distance.
@@ -75,44 +162,63 @@ def heuristic(node: SearchTreeNode, targets_left: list[tuple[int, int]], problem
     Parameters:
         node (SearchTreeNode):
             Current node along the path.
-        targets_left (list[tuple[int, int]]):
-            List of the targets that are yet to be shot.
+        cost_prefixes (CostPrefixes):
+            Prefix-summed transition costs used to price each straight-line
+            run in constant time.
 
     Returns
         int:
             The priority of the node based on the heuristic method.
     """
-    future_cost: int = 0
-    
-    for target in targets_left:
-        future_cost_x: int = 0
-        future_cost_y: int = 0
-        
-        if node.player_loc[0] < target[0]:
-            for num in range(node.player_loc[0], target[0]):
-                future_cost_x += problem.get_transition_cost("R", (num, node.player_loc[1]))
-        else:
-            for num in range(target[0], node.player_loc[0]):
-                future_cost_x += problem.get_transition_cost("L", (num, node.player_loc[1]))
-
-        if node.player_loc[1] < target[1]:
-            for num in range(node.player_loc[1], target[1]):
-                future_cost_y += problem.get_transition_cost("U", (node.player_loc[0], num))
-        else:
-            for num in range(target[1], node.player_loc[1]):
-                future_cost_y += problem.get_transition_cost("D", (node.player_loc[0], num))
-
-        if future_cost_x <= future_cost_y:
-            future_cost += future_cost_x
-        else:
-            future_cost += future_cost_y
-
-    priority: int = node.past_cost + future_cost
-    return priority
-
-
-def get_targets_left(node: SearchTreeNode, problem: "MazeProblem") -> list[tuple[int, int]]:
-    targets_left: list[tuple[int, int]] = [item for item in problem.get_initial_targets() if item not in node.shot_targets]
+    return node.past_cost + future_cost(node.player_loc, node.shot_mask, cost_prefixes)
+
+
+def future_cost(player_loc: tuple[int, int], shot_mask: int, cost_prefixes: "CostPrefixes") -> int:
+    """
+    Computes the heuristic's future-cost term for a search state, independent
+    of any SearchTreeNode, so pathfind can price children before allocating
+    their nodes. The remaining targets are implied by the shot mask and only
+    decoded into coordinates when the memo misses.
+
+    Parameters:
+        player_loc (tuple[int, int]):
+            The player's location in the state being priced.
+        shot_mask (int):
+            The state's shot-target bitmask, keying the memo.
+        cost_prefixes (CostPrefixes):
+            Prefix-summed transition costs used to price each straight-line
+            run in constant time, plus the bit-to-target list for decoding.
+
+    Returns:
+        int:
+            The estimated cost of shooting every remaining target.
+    """
+    # Future cost depends only on (location, shot targets), so duplicate
+    # frontier entries for the same search state reuse the memoized value
+    state_key: tuple[tuple[int, int], int] = (player_loc, shot_mask)
+    cached: Optional[int] = cost_prefixes.future_costs.get(state_key)
+    if cached is not None:
+        return cached
+
+    # The player's coordinates and the bound line_cost method are shared by
+    # every target, so hoist them out of the loop once per call
+    player_x, player_y = player_loc
+    line_cost = cost_prefixes.line_cost
+    total: int = 0
+
+    for target_x, target_y in get_targets_left(shot_mask, cost_prefixes.target_list):
+        future_cost_x: int = line_cost("R", player_y, player_x, target_x) if player_x < target_x \
+            else line_cost("L", player_y, target_x, player_x)
+        future_cost_y: int = line_cost("U", player_x, player_y, target_y) if player_y < target_y \
+            else line_cost("D", player_x, target_y, player_y)
+        total += future_cost_x if future_cost_x <= future_cost_y else future_cost_y
+
+    cost_prefixes.future_costs[state_key] = total
+    return total
+
+
+def get_targets_left(shot_mask: int, target_list: list[tuple[int, int]]) -> set[tuple[int, int]]:
+    targets_left: set[tuple[int, int]] = {target for bit, target in enumerate(target_list) if not shot_mask >> bit & 1}
     return targets_left
 
 
@@ -134,32 +240,68 @@ def pathfind(problem: "MazeProblem") -> Optional[list[str]]:
             possible, returns None.
     """
 
-    frontier: queue.PriorityQueue[SearchTreeNode] = queue.PriorityQueue()
+    # Plain list-based binary heap; SearchTreeNode.__lt__ orders it by priority
+    frontier: list["SearchTreeNode"] = []
+
+    # Fixed bit assignment for this search: bit i of a node's shot_mask says
+    # whether target_list[i] has been shot, making state keys O(1) to hash
+    target_list: list[tuple[int, int]] = sorted(problem.get_initial_targets())
+    target_index: dict[tuple[int, int], int] = {target: bit for bit, target in enumerate(target_list)}
+    all_mask: int = (1 << len(target_list)) - 1
+    cost_prefixes: "CostPrefixes" = CostPrefixes(problem, target_list)
+
     initial_priority: int = 1
-    initial_state: "SearchTreeNode" = SearchTreeNode(problem.get_initial_loc(), "", None, [], 0, initial_priority)
-    frontier.put(initial_state)
-
-    # list of tuple[location, shot_targets]
-    graveyard: Set[tuple[tuple[int, int], list[tuple[int, int]]]] = set()
-
-    while not frontier.empty():
-        parent_node: "SearchTreeNode" = frontier.get()
-        graveyard.add((parent_node.player_loc, parent_node.shot_targets))
-        targets_left: list[tuple[int, int]] = get_targets_left(parent_node, problem)
-        children: dict = problem.get_transitions(parent_node.player_loc, set(targets_left))
-
-        for child in children.items():
-            temp_priority: int = 0
-            new_node: "SearchTreeNode" = SearchTreeNode(child[1]["next_loc"], child[0], parent_node, list(parent_node.shot_targets), parent_node.past_cost, temp_priority)
-            new_node.past_cost += child[1]["cost"]
-            new_node.shot_targets.extend(child[1]["targets_hit"])
-            targets_left = get_targets_left(new_node, problem)
-            new_node.priority = heuristic(new_node, targets_left, problem)
-
-            if set(new_node.shot_targets) == problem.get_initial_targets():
-                return find_solution_path(new_node)
-
-            if (new_node.player_loc, new_node.shot_targets) not in graveyard:
-                frontier.put(new_node)
+    initial_state: "SearchTreeNode" = make_node(problem.get_initial_loc(), "", None, 0, 0, initial_priority)
+    heapq.heappush(frontier, initial_state)
+
+    # set of tuple[location, shot_mask]
+    graveyard: Set[tuple[tuple[int, int], int]] = set()
+
+    # Bind the per-expansion methods to locals once, skipping the attribute
+    # lookup that each call in the loop would otherwise repeat
+    get_transitions = problem.get_transitions
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    bury = graveyard.add
+
+    while frontier:
+        parent_node: "SearchTreeNode" = heappop(frontier)
+        bury((parent_node.player_loc, parent_node.shot_mask))
+        targets_left: set[tuple[int, int]] = get_targets_left(parent_node.shot_mask, target_list)
+        children: dict = get_transitions(parent_node.player_loc, targets_left)
+        kept_children: int = 0
+
+        # The parent's fields are shared by every child, so read them once
+        # per expansion rather than once per generated node
+        parent_mask: int = parent_node.shot_mask
+        parent_past: int = parent_node.past_cost
+
+        for action, info in children.items():
+            targets_hit: list[tuple[int, int]] = info["targets_hit"]
+            new_mask: int = parent_mask
+            for target in targets_hit:
+                new_mask |= 1 << target_index[target]
+            new_loc: tuple[int, int] = info["next_loc"]
+
+            if new_mask == all_mask:
+                return find_solution_path(make_node(new_loc, action, parent_node, new_mask, parent_past + info["cost"], 0))
+
+            # Checking the graveyard before building the node means dead-end
+            # children are never allocated at all
+            if (new_loc, new_mask) in graveyard:
+                continue
+
+            # Price the child before building it: its node is only allocated
+            # with the final priority already in hand
+            new_past: int = parent_past + info["cost"]
+            priority: int = new_past + future_cost(new_loc, new_mask, cost_prefixes)
+            heappush(frontier, make_node(new_loc, action, parent_node, new_mask, new_past, priority))
+            kept_children += 1
+
+        # A node with no surviving children is referenced by nothing once
+        # expanded, so it can be recycled; kept children hold their parent for
+        # find_solution_path, which keeps the rest of the tree alive
+        if kept_children == 0:
+            _node_pool.append(parent_node)
 
     return None
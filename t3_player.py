@@ -1,100 +1,368 @@
 """
 Artificial Intelligence responsible for playing the game of T3!
-Implements the alpha-beta-pruning mini-max search algorithm
+Implements the negamax formulation of alpha-beta-pruned mini-max search
+with principal-variation search
 """
 from dataclasses import *
 from typing import *
 from t3_state import *
 
+# Transposition-table bound flags: whether a stored value is exact, or only a
+# lower / upper bound on the true negamax value (from a search that cut off)
+_EXACT, _LOWER, _UPPER = 0, 1, 2
 
-def alphabeta(state: "T3State", alpha: float, beta: float, odd_turn: bool, parent: "T3Node") -> tuple[float, int, "T3Action"]:
+# Smallest gap between distinct utilities (they are quantized to 0, 0.5, 1), so
+# a PVS null window of this width can be passed by at most one distinct score
+_PVS_WINDOW: float = 0.25
+
+# A board frozen as a tuple of row tuples, and the (board, turn parity) pair
+# used to key the caches below
+_Board = tuple[tuple[int, ...], ...]
+_StateKey = tuple[_Board, bool]
+
+# Module-level transposition table persisted across choose() calls so repeated
+# positions -- whether transposed within one search or revisited across turns --
+# are looked up rather than re-searched. Keyed by the lexicographically-minimal
+# rotation/reflection of the board plus turn parity, so all 8 symmetric
+# orientations of a position share one entry; values are (side-to-move
+# utility, depth of the chosen terminal relative to the stored position, bound
+# flag, best action in the canonical frame, draft). The draft is the search
+# horizon that remained below the node when the entry was computed: a lookup
+# may only trust the value when the stored draft covers its own remaining
+# horizon, though the best action is always a valid ordering hint.
+_TRANSPOSITION_TABLE: dict[_StateKey, tuple[float, int, int, "T3Action", int]] = {}
+
+
+def _build_transforms() -> list[dict[tuple[int, int], tuple[int, int]]]:
+    """
+    Builds the 8 symmetries of the 3x3 board (4 rotations, each optionally
+    mirrored) as (col, row) -> (col, row) cell mappings, with the identity
+    first.
+
+    Returns:
+        list[dict[tuple[int, int], tuple[int, int]]]:
+            One coordinate mapping per symmetry.
     """
-    Recrusive method that completes the alpha-beta pruning with the given criteria,
-    returning the best terminal action with the utility score.
+    transforms: list[dict[tuple[int, int], tuple[int, int]]] = []
+    for mirror in (False, True):
+        for quarter_turns in range(4):
+            mapping: dict[tuple[int, int], tuple[int, int]] = {}
+            for col in range(3):
+                for row in range(3):
+                    new_col, new_row = (2 - col, row) if mirror else (col, row)
+                    for _ in range(quarter_turns):
+                        new_col, new_row = 2 - new_row, new_col
+                    mapping[(col, row)] = (new_col, new_row)
+            transforms.append(mapping)
+    return transforms
+
+
+# The 8 board symmetries and, for translating cached actions back into a
+# node's own frame, their inverse coordinate mappings
+_TRANSFORMS: list[dict[tuple[int, int], tuple[int, int]]] = _build_transforms()
+_INVERSES: list[dict[tuple[int, int], tuple[int, int]]] = [{after: before for before, after in mapping.items()} for mapping in _TRANSFORMS]
+
+# Memoized canonicalizations: plain (board, parity) key -> (canonical key,
+# index of the transform that produced it)
+_CANONICAL_CACHE: dict[_StateKey, tuple[_StateKey, int]] = {}
+
+
+def _canonicalize(state: "T3State", odd_turn: bool) -> tuple[_StateKey, _StateKey, int]:
+    """
+    Computes the state's plain cache key alongside its canonical
+    transposition-table key: the lexicographically smallest of the board's 8
+    rotations/reflections, paired with the turn parity.
+
+    [!] Reads the board grid off the course T3State's internal _state
+    attribute, which the class exposes no public accessor for.
+
+    Parameters:
+        state ("T3State"):
+            The state being keyed.
+        odd_turn (bool):
+            Whose turn it is at the state.
+
+    Returns:
+        tuple[_StateKey, _StateKey, int]:
+            The plain (board, parity) key, the canonical key, and the index
+            of the transform mapping the board onto its canonical form.
+    """
+    board: _Board = tuple(tuple(row) for row in state._state)
+    plain_key: _StateKey = (board, odd_turn)
+    cached: Optional[tuple[_StateKey, int]] = _CANONICAL_CACHE.get(plain_key)
+    if cached is None:
+        best_board: Optional[_Board] = None
+        best_transform: int = 0
+        for transform, mapping in enumerate(_TRANSFORMS):
+            cells: list[list[int]] = [[0] * 3 for _ in range(3)]
+            for (col, row), (new_col, new_row) in mapping.items():
+                cells[new_row][new_col] = board[row][col]
+            candidate: _Board = tuple(tuple(cell_row) for cell_row in cells)
+            if best_board is None or candidate < best_board:
+                best_board = candidate
+                best_transform = transform
+        cached = ((cast(_Board, best_board), odd_turn), best_transform)
+        _CANONICAL_CACHE[plain_key] = cached
+    return plain_key, cached[0], cached[1]
+
+
+def _transform_action(action: "T3Action", transform: int) -> "T3Action":
+    """
+    Maps an action into the canonical frame of the given board symmetry; the
+    move number is unaffected by symmetry.
+
+    Parameters:
+        action ("T3Action"):
+            The action in the node's own frame.
+        transform (int):
+            The index of the symmetry mapping the node onto its canonical form.
+
+    Returns:
+        "T3Action":
+            The equivalent action on the canonical board.
+    """
+    col, row = _TRANSFORMS[transform][(action.col(), action.row())]
+    return T3Action(col, row, action.move())
+
+
+def _untransform_action(action: "T3Action", transform: int) -> "T3Action":
+    """
+    Maps a canonical-frame action back into the frame of a node whose board
+    canonicalizes under the given symmetry.
+
+    Parameters:
+        action ("T3Action"):
+            The action in the canonical frame.
+        transform (int):
+            The index of the symmetry mapping the node onto its canonical form.
+
+    Returns:
+        "T3Action":
+            The equivalent action on the node's own board.
+    """
+    col, row = _INVERSES[transform][(action.col(), action.row())]
+    return T3Action(col, row, action.move())
+
+# History heuristic: counts how often each (col, row, move) has produced a
+# beta-cutoff, so frequently-refuting moves are searched earlier in later nodes
+_HISTORY: dict[tuple[int, int, int], int] = {}
+
+# Ordered transition lists memoized per position, so revisits -- including
+# through the TT -- skip both the successor re-generation and the O(b log b)
+# sort. Each entry carries the action's (col, row, move) triple so the search
+# loop never re-extracts it through method calls. Keyed by the plain (board,
+# parity) key, not the canonical one, since the actions and successors are
+# frame-specific.
+_TRANSITIONS_CACHE: dict[_StateKey, list[tuple[tuple[int, int, int], "T3Action", "T3State"]]] = {}
+
+
+def _order_transitions(state: "T3State", tt_action: Optional["T3Action"], key: _StateKey) -> list[tuple[tuple[int, int, int], "T3Action", "T3State"]]:
+    """
+    Orders a state's transitions to maximize alpha-beta cutoffs: the
+    transposition table's remembered best move first, then moves by descending
+    history-heuristic score, with the earliest (col, row, move) breaking ties.
+    The sorted list is cached per position; revisits only rotate the current
+    TT move to the front rather than re-sorting.
+
+    Parameters:
+        state ("T3State"):
+            The state whose transitions are to be ordered.
+        tt_action (Optional["T3Action"]):
+            The best action stored for this state in the transposition table,
+            if any, searched first when present.
+        key (_StateKey):
+            The position's plain (board, parity) key, indexing the
+            transition cache.
+
+    Returns:
+        list[tuple[tuple[int, int, int], "T3Action", "T3State"]]:
+            The state's ((col, row, move), action, successor) transitions,
+            best-first.
+    """
+    transitions: Optional[list[tuple[tuple[int, int, int], "T3Action", "T3State"]]] = _TRANSITIONS_CACHE.get(key)
+    if transitions is None:
+        transitions = [((action.col(), action.row(), action.move()), action, successor)
+                       for action, successor in state.get_transitions()]
+        transitions.sort(key=lambda entry: (-_HISTORY.get(entry[0], 0), entry[0]))
+        _TRANSITIONS_CACHE[key] = transitions
+
+    if tt_action is not None:
+        tt_key: tuple[int, int, int] = (tt_action.col(), tt_action.row(), tt_action.move())
+        for index, entry in enumerate(transitions):
+            if entry[0] == tt_key:
+                if index:
+                    transitions.insert(0, transitions.pop(index))
+                break
+    return transitions
+
+
+def negamax(state: "T3State", alpha: float, beta: float, odd_turn: bool, depth: int, limit: int) -> tuple[float, int, Optional["T3Action"]]:
+    """
+    Recursive fail-soft negamax search with alpha-beta pruning and
+    principal-variation search: every node maximizes the utility of the player
+    to move, scoring each child as one minus the child's own negamax value, so
+    the max and min branches of classic mini-max collapse into one loop. The
+    first (best-ordered) child is searched with the full window; remaining
+    children are probed with a null window just above alpha and re-searched
+    with the full window only when the probe reveals a new best move.
+
+    [!] Utilities live in [0, 1] with 0.5 a tie, so the negamax reflection is
+    score = 1 - child_score (and a child window of [1 - beta, 1 - alpha])
+    rather than the usual negation.
 
     Parameters:
         state (T3State):
-            The state of the map with the given node.
+            The state being searched.
         alpha (float):
-            The alpha value with the given node.
+            The lower bound of the search window, from the perspective of the
+            player to move.
         beta (float):
-            The beta value with the given node.
+            The upper bound of the search window.
         odd_turn (bool):
-            A boolean that tells if it is an odd or even turn, telling if it is a min or max node.
-        player (T3Player):
-            The player node, which includes the node's action, utility score, and depth.
+            A boolean that tells if it is an odd or even turn at this node.
+        depth (int):
+            The depth of this node below the root, used to keep the root on a
+            full window so its candidates compare exactly.
+        limit (int):
+            The iterative-deepening horizon: non-terminal nodes at this depth
+            return the neutral score 0.5 rather than searching deeper.
 
     Returns:
-        tuple[float, int, "T3Action"]:
-            The utility score that the node leads to, the depth of the node, and the action taken to get there.
-    """
-    
-    if odd_turn and state.is_win():
-        return 0, parent.depth, parent.action
-    elif not odd_turn and state.is_win():
-        return 1, parent.depth, parent.action
+        tuple[float, int, Optional["T3Action"]]:
+            The utility of the position for the player to move, the depth of
+            the chosen terminal relative to this node, and the best action
+            from here (None at terminals).
+    """
+
+    if state.is_win():
+        # The previous player completed a winning line, so the side to move lost
+        return 0.0, 0, None
     elif state.is_tie():
-        return 0.5, parent.depth, parent.action
-
-    child: "T3Node" = T3Node(parent.action, float("-inf"), parent.depth + 1)
-
-    if odd_turn:
-        parent.utility_score = float("-inf")
-        for transition in state.get_transitions():
-            child.action = transition[0]
-            temp_child = alphabeta(transition[1], alpha, beta, False, child)
-            child.utility_score = temp_child[0]
-            child.depth = temp_child[1]
-            if check_best_option((child.utility_score, child.depth, child.action), (parent.utility_score, parent.depth, parent.action)):
-                parent.action = transition[0]
-                parent.depth = child.depth
-            parent.utility_score = max(parent.utility_score, child.utility_score)
-            alpha = max(alpha, parent.utility_score)
-            if beta <= alpha:
-                break
-        return parent.utility_score, parent.depth, parent.action
+        return 0.5, 0, None
+    elif depth >= limit:
+        # Horizon reached mid-game: score as a neutral unknown; only entries
+        # with a covering draft may reuse this value
+        return 0.5, 0, None
 
-    else:
-        parent.utility_score = float("inf")
-        for transition in state.get_transitions():
-            child.action = transition[0]
-            temp_child = alphabeta(transition[1], alpha, beta, True, child)
-            child.utility_score = temp_child[0]
-            child.depth = temp_child[1]
-            if check_best_option((child.utility_score, child.depth, child.action), (parent.utility_score, parent.depth, parent.action)):
-                parent.action = transition[0]
-                parent.depth = child.depth
-            parent.utility_score = min(parent.utility_score, child.utility_score)
-            beta = min(beta, parent.utility_score)
+    draft: int = limit - depth
+    key, tt_key, transform = _canonicalize(state, odd_turn)
+    tt_move: Optional["T3Action"] = None
+    entry: Optional[tuple[float, int, int, "T3Action", int]] = _TRANSPOSITION_TABLE.get(tt_key)
+    if entry is not None:
+        tt_value, tt_depth, tt_flag, tt_action, tt_draft = entry
+        # Entries are shared by all 8 orientations of the position, so the
+        # stored action must be mapped back into this node's frame
+        tt_move = _untransform_action(tt_action, transform)
+        # The root never takes early TT exits or narrows its window, so every
+        # root candidate is scored exactly for the tie-break comparison; values
+        # from a shallower draft only supply the ordering hint above
+        if depth > 0 and tt_draft >= draft:
+            if tt_flag == _EXACT:
+                return tt_value, tt_depth, tt_move
+            elif tt_flag == _LOWER:
+                alpha = max(alpha, tt_value)
+            else:
+                beta = min(beta, tt_value)
             if beta <= alpha:
-                break
-        return parent.utility_score, parent.depth, parent.action
+                return tt_value, tt_depth, tt_move
+    alpha_orig: float = alpha
+    beta_orig: float = beta
+
+    best_score: float = float("-inf")
+    best_depth: int = 0
+    # best_key mirrors best_action's (col, row, move); its initial value is
+    # never compared because the first candidate is taken unconditionally
+    best_key: tuple[int, int, int] = (0, 0, 0)
+    best_action: Optional["T3Action"] = None
+
+    child_turn: bool = not odd_turn
+    child_depth: int = depth + 1
 
+    for act_key, action, successor in _order_transitions(state, tt_move, key):
+        search_alpha: float = alpha
+        if best_action is None or depth == 0:
+            child_score, terminal_depth, _ = negamax(successor, 1.0 - beta, 1.0 - alpha, child_turn, child_depth, limit)
+            score: float = 1.0 - child_score
+        else:
+            # PVS: probe with a null window just above alpha; only a probe that
+            # beats alpha within the real window warrants a full re-search
+            child_score, terminal_depth, _ = negamax(successor, 1.0 - (alpha + _PVS_WINDOW), 1.0 - alpha, child_turn, child_depth, limit)
+            score = 1.0 - child_score
+            if alpha < score < beta:
+                child_score, terminal_depth, _ = negamax(successor, 1.0 - beta, 1.0 - alpha, child_turn, child_depth, limit)
+                score = 1.0 - child_score
+        # A child's value is only exact when strictly inside its search window;
+        # bound results must not win the best-option comparison, which is
+        # inlined here: better utility, then shallower terminal, then
+        # earliest (col, row, move)
+        if search_alpha < score < beta or best_action is None:
+            cand_depth: int = terminal_depth + 1
+            if best_action is None or score > best_score \
+                    or (score == best_score and (cand_depth < best_depth
+                                                 or (cand_depth == best_depth and act_key < best_key))):
+                best_depth = cand_depth
+                best_key = act_key
+                best_action = action
+        if score > best_score:
+            best_score = score
+        if depth > 0 and best_score > alpha:
+            alpha = best_score
+        if beta <= alpha:
+            _record_cutoff(act_key)
+            break
+    _tt_store(tt_key, best_score, best_depth, alpha_orig, beta_orig, _transform_action(best_action, transform), draft)
+    return best_score, best_depth, best_action
 
-def check_best_option(option1: tuple[float, int, "T3Action"], option2: tuple[float, int, "T3Action"]) -> bool:
+
+def _record_cutoff(act_key: tuple[int, int, int]) -> None:
     """
-    Compares two options for a tiebreaker and returns the option that's best in terms of the tie-breaker criteria.
-    Specifically, it first checks the utility score, then the depth of the terminal node, and then the earliest move.
+    Credits the given action in the history heuristic for having just caused a
+    beta-cutoff, so _order_transitions tries it earlier at other nodes.
 
     Parameters:
-        option1 (tuple[float, int, "T3Action"]):
-            The first tiebreaker option, which is a tuple that includes a float which is the utility score,
-            an int which is the depth of the node,
-            and an action which can be used to find the column, row, and move of the action.
-        option2 (tuple[float, int, "T3Action"]):
-            The second tiebreaker option, which is a tuple that includes a float which is the utility score,
-            an int which is the depth of the node,
-            and an action which can be used to find the column, row, and move of the action.
+        act_key (tuple[int, int, int]):
+            The (col, row, move) triple of the action whose search caused the
+            cutoff.
 
     Returns:
-        bool:
-            Whether option1 is the better option than option2, checking the utility score, depth, and action of the node.
+        None
+    """
+    _HISTORY[act_key] = _HISTORY.get(act_key, 0) + 1
+
+
+def _tt_store(key: _StateKey, value: float, rel_depth: int, alpha_orig: float, beta_orig: float, action: "T3Action", draft: int) -> None:
     """
+    Records a finished node's search result in the transposition table, flagging
+    whether the value is exact or merely a bound given the alpha-beta window the
+    node was searched under.
 
-    optionA: tuple[float, int, int, int, int] = (-option1[0], option1[1], option1[2].col(), option1[2].row(), option1[2].move())
-    optionB: tuple[float, int, int, int, int] = (-option2[0], option2[1], option2[2].col(), option2[2].row(), option2[2].move())
+    Parameters:
+        key (_StateKey):
+            The canonical transposition-table key of the searched position.
+        value (float):
+            The utility score the search returned for the position.
+        rel_depth (int):
+            The depth of the chosen terminal relative to the searched node.
+        alpha_orig, beta_orig (float):
+            The alpha-beta window the node was searched under; values at or
+            outside its edges are stored as bounds rather than exact scores.
+        action ("T3Action"):
+            The best action found from the position.
+        draft (int):
+            The search horizon that remained below the node, bounding which
+            later lookups may trust the stored value.
 
-    return optionA < optionB
+    Returns:
+        None
+    """
+    flag: int
+    if value <= alpha_orig:
+        flag = _UPPER
+    elif value >= beta_orig:
+        flag = _LOWER
+    else:
+        flag = _EXACT
+    _TRANSPOSITION_TABLE[key] = (value, rel_depth, flag, action, draft)
 
 
 def choose(state: "T3State") -> Optional["T3Action"]:
@@ -131,32 +399,14 @@ def choose(state: "T3State") -> Optional["T3Action"]:
     is_odd: bool = True
     alpha: float = float("-inf")
     beta: float = float("inf")
-    action: "T3Action" = T3Action(0, 0, 0)
-    start_node: "T3Node" = T3Node(action, 0.0, 0)
 
-    choice = alphabeta(state, alpha, beta, is_odd, start_node)
+    # Iterative deepening: each shallow pass costs little but seeds the
+    # transposition table's best moves, so the next pass searches nearly
+    # best-first. The final pass covers every open tile -- the full remaining
+    # game -- so the returned choice is exact.
+    max_limit: int = len(state.get_open_tiles())
+    choice: tuple[float, int, Optional["T3Action"]] = (0.5, 0, None)
+    for limit in range(1, max_limit + 1):
+        choice = negamax(state, alpha, beta, is_odd, 0, limit)
     return choice[2]
 
-
-class T3Node:
-    """
-    Helper class representation of a node, which will contain the action, utility score, and depth of the node.
-    Make T3Node objects to compare to see which object is the best.
-    """
-
-    def __init__(self, action: "T3Action", utility_score: float, depth: int):
-        """
-        Constructs a new T3Node from the provided action, utility score, and depth.
-        
-        Parameters:
-            action (T3Action):
-                The action being taken on the node.
-            utility_score (float):
-                The minimax score, or utility score, at the node.
-            depth (int):
-                The depth of the node, specifically a count of iterations through the depth first search.
-        """
-        self.action: "T3Action" = action
-        self.utility_score: float = utility_score
-        self.depth: int = depth
-